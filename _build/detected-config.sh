@@ -0,0 +1,3 @@
+READLINE_DIR=
+HAVE_READLINE=1
+PREFIX=/usr/local
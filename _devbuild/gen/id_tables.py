@@ -0,0 +1,757 @@
+# Generated by core/id_kind_gen.py.  Do not edit.
+
+ID_NAMES = {
+    1: 'Undefined_Tok',
+    2: 'Unknown_Tok',
+    3: 'Eol_Tok',
+    4: 'Eof_Real',
+    5: 'Eof_RParen',
+    6: 'Eof_Backtick',
+    7: 'Ignored_LineCont',
+    8: 'Ignored_Space',
+    9: 'Ignored_Comment',
+    10: 'WS_Space',
+    11: 'Lit_Chars',
+    12: 'Lit_VarLike',
+    13: 'Lit_ArrayLhsOpen',
+    14: 'Lit_ArrayLhsClose',
+    15: 'Lit_Other',
+    16: 'Lit_EscapedChar',
+    17: 'Lit_LBrace',
+    18: 'Lit_RBrace',
+    19: 'Lit_Comma',
+    20: 'Lit_DRightBracket',
+    21: 'Lit_TildeLike',
+    22: 'Lit_Pound',
+    23: 'Lit_Slash',
+    24: 'Lit_Percent',
+    25: 'Lit_Digits',
+    26: 'Lit_At',
+    27: 'Lit_ArithVarLike',
+    28: 'Lit_CompDummy',
+    29: 'Backtick_Right',
+    30: 'Backtick_Quoted',
+    31: 'Backtick_Other',
+    32: 'History_Op',
+    33: 'History_Num',
+    34: 'History_Search',
+    35: 'History_Other',
+    36: 'Op_Newline',
+    37: 'Op_Amp',
+    38: 'Op_Pipe',
+    39: 'Op_PipeAmp',
+    40: 'Op_DAmp',
+    41: 'Op_DPipe',
+    42: 'Op_Semi',
+    43: 'Op_DSemi',
+    44: 'Op_LParen',
+    45: 'Op_RParen',
+    46: 'Op_DLeftParen',
+    47: 'Op_DRightParen',
+    48: 'Op_LBracket',
+    49: 'Op_RBracket',
+    50: 'Op_LBrace',
+    51: 'Op_RBrace',
+    52: 'Op_Bang',
+    53: 'Redir_Less',
+    54: 'Redir_Great',
+    55: 'Redir_DLess',
+    56: 'Redir_TLess',
+    57: 'Redir_DGreat',
+    58: 'Redir_GreatAnd',
+    59: 'Redir_LessAnd',
+    60: 'Redir_DLessDash',
+    61: 'Redir_LessGreat',
+    62: 'Redir_Clobber',
+    63: 'Redir_AndGreat',
+    64: 'Redir_AndDGreat',
+    65: 'Redir_GreatPlus',
+    66: 'Redir_DGreatPlus',
+    67: 'Fd_Number',
+    68: 'Fd_Name',
+    69: 'Left_DoubleQuote',
+    70: 'Left_SingleQuote',
+    71: 'Left_Backtick',
+    72: 'Left_CommandSub',
+    73: 'Left_VarSub',
+    74: 'Left_ArithSub',
+    75: 'Left_ArithSub2',
+    76: 'Left_DollarDoubleQuote',
+    77: 'Left_DollarSingleQuote',
+    78: 'Left_ProcSubIn',
+    79: 'Left_ProcSubOut',
+    80: 'Left_ParenSub',
+    81: 'Left_BraceSub',
+    82: 'Left_BracketSub',
+    83: 'Right_DoubleQuote',
+    84: 'Right_SingleQuote',
+    85: 'Right_Backtick',
+    86: 'Right_CommandSub',
+    87: 'Right_VarSub',
+    88: 'Right_ArithSub',
+    89: 'Right_DollarDoubleQuote',
+    90: 'Right_DollarSingleQuote',
+    91: 'Right_Subshell',
+    92: 'Right_FuncDef',
+    93: 'Right_CasePat',
+    94: 'Right_ArrayLiteral',
+    95: 'Right_ExtGlob',
+    96: 'ExtGlob_At',
+    97: 'ExtGlob_Star',
+    98: 'ExtGlob_Plus',
+    99: 'ExtGlob_QMark',
+    100: 'ExtGlob_Bang',
+    101: 'VSub_DollarName',
+    102: 'VSub_Name',
+    103: 'VSub_Number',
+    104: 'VSub_Bang',
+    105: 'VSub_At',
+    106: 'VSub_Pound',
+    107: 'VSub_Dollar',
+    108: 'VSub_Star',
+    109: 'VSub_Hyphen',
+    110: 'VSub_QMark',
+    111: 'VTest_ColonHyphen',
+    112: 'VTest_Hyphen',
+    113: 'VTest_ColonEquals',
+    114: 'VTest_Equals',
+    115: 'VTest_ColonQMark',
+    116: 'VTest_QMark',
+    117: 'VTest_ColonPlus',
+    118: 'VTest_Plus',
+    119: 'VOp0_Q',
+    120: 'VOp0_E',
+    121: 'VOp0_P',
+    122: 'VOp0_A',
+    123: 'VOp0_a',
+    124: 'VOp1_Percent',
+    125: 'VOp1_DPercent',
+    126: 'VOp1_Pound',
+    127: 'VOp1_DPound',
+    128: 'VOp1_Caret',
+    129: 'VOp1_DCaret',
+    130: 'VOp1_Comma',
+    131: 'VOp1_DComma',
+    132: 'VOp2_Slash',
+    133: 'VOp2_Colon',
+    134: 'VOp2_LBracket',
+    135: 'VOp2_RBracket',
+    136: 'Arith_Semi',
+    137: 'Arith_Comma',
+    138: 'Arith_Plus',
+    139: 'Arith_Minus',
+    140: 'Arith_Star',
+    141: 'Arith_Slash',
+    142: 'Arith_Percent',
+    143: 'Arith_DPlus',
+    144: 'Arith_DMinus',
+    145: 'Arith_DStar',
+    146: 'Arith_LParen',
+    147: 'Arith_RParen',
+    148: 'Arith_LBracket',
+    149: 'Arith_RBracket',
+    150: 'Arith_RBrace',
+    151: 'Arith_QMark',
+    152: 'Arith_Colon',
+    153: 'Arith_LessEqual',
+    154: 'Arith_Less',
+    155: 'Arith_GreatEqual',
+    156: 'Arith_Great',
+    157: 'Arith_DEqual',
+    158: 'Arith_NEqual',
+    159: 'Arith_DAmp',
+    160: 'Arith_DPipe',
+    161: 'Arith_Bang',
+    162: 'Arith_DGreat',
+    163: 'Arith_DLess',
+    164: 'Arith_Amp',
+    165: 'Arith_Pipe',
+    166: 'Arith_Caret',
+    167: 'Arith_Tilde',
+    168: 'Arith_Equal',
+    169: 'Arith_PlusEqual',
+    170: 'Arith_MinusEqual',
+    171: 'Arith_StarEqual',
+    172: 'Arith_SlashEqual',
+    173: 'Arith_PercentEqual',
+    174: 'Arith_DGreatEqual',
+    175: 'Arith_DLessEqual',
+    176: 'Arith_AmpEqual',
+    177: 'Arith_PipeEqual',
+    178: 'Arith_CaretEqual',
+    179: 'Node_PostDPlus',
+    180: 'Node_PostDMinus',
+    181: 'Node_UnaryPlus',
+    182: 'Node_UnaryMinus',
+    183: 'Node_Command',
+    184: 'Node_Assign',
+    185: 'Node_AndOr',
+    186: 'Node_Block',
+    187: 'Node_Subshell',
+    188: 'Node_Fork',
+    189: 'Node_FuncDef',
+    190: 'Node_ForEach',
+    191: 'Node_ForExpr',
+    192: 'Node_NoOp',
+    193: 'Node_UnaryExpr',
+    194: 'Node_BinaryExpr',
+    195: 'Node_TernaryExpr',
+    196: 'Node_FuncCall',
+    197: 'Node_ConstInt',
+    198: 'Word_Compound',
+    199: 'KW_DLeftBracket',
+    200: 'KW_Bang',
+    201: 'KW_For',
+    202: 'KW_While',
+    203: 'KW_Until',
+    204: 'KW_Do',
+    205: 'KW_Done',
+    206: 'KW_In',
+    207: 'KW_Case',
+    208: 'KW_Esac',
+    209: 'KW_If',
+    210: 'KW_Fi',
+    211: 'KW_Then',
+    212: 'KW_Else',
+    213: 'KW_Elif',
+    214: 'KW_Function',
+    215: 'KW_Time',
+    216: 'KW_Const',
+    217: 'KW_Set',
+    218: 'KW_SetGlobal',
+    219: 'KW_Var',
+    220: 'KW_Fork',
+    221: 'KW_Shell',
+    222: 'KW_Proc',
+    223: 'KW_Func',
+    224: 'KW_Match',
+    225: 'KW_With',
+    226: 'Assign_Declare',
+    227: 'Assign_Typeset',
+    228: 'Assign_Local',
+    229: 'Assign_Readonly',
+    230: 'Assign_None',
+    231: 'ControlFlow_Break',
+    232: 'ControlFlow_Continue',
+    233: 'ControlFlow_Return',
+    234: 'ControlFlow_Exit',
+    235: 'Char_OneChar',
+    236: 'Char_Stop',
+    237: 'Char_Hex',
+    238: 'Char_Octal3',
+    239: 'Char_Octal4',
+    240: 'Char_Unicode4',
+    241: 'Char_Unicode8',
+    242: 'Char_Literals',
+    243: 'Char_BadBackslash',
+    244: 'Glob_LBracket',
+    245: 'Glob_RBracket',
+    246: 'Glob_Star',
+    247: 'Glob_QMark',
+    248: 'Glob_Bang',
+    249: 'Glob_Caret',
+    250: 'Glob_EscapedChar',
+    251: 'Glob_BadBackslash',
+    252: 'Glob_CleanLiterals',
+    253: 'Glob_OtherLiteral',
+    254: 'Glob_Eof',
+    255: 'PS_Subst',
+    256: 'PS_Octal3',
+    257: 'PS_LBrace',
+    258: 'PS_RBrace',
+    259: 'PS_Literals',
+    260: 'PS_BadBackslash',
+    261: 'BoolUnary_o',
+    262: 'BoolUnary_t',
+    263: 'BoolUnary_v',
+    264: 'BoolUnary_R',
+    265: 'BoolUnary_a',
+    266: 'BoolUnary_b',
+    267: 'BoolUnary_c',
+    268: 'BoolUnary_d',
+    269: 'BoolUnary_e',
+    270: 'BoolUnary_f',
+    271: 'BoolUnary_g',
+    272: 'BoolUnary_h',
+    273: 'BoolUnary_L',
+    274: 'BoolUnary_p',
+    275: 'BoolUnary_r',
+    276: 'BoolUnary_s',
+    277: 'BoolUnary_S',
+    278: 'BoolUnary_u',
+    279: 'BoolUnary_w',
+    280: 'BoolUnary_x',
+    281: 'BoolUnary_O',
+    282: 'BoolUnary_G',
+    283: 'BoolUnary_N',
+    284: 'BoolUnary_z',
+    285: 'BoolUnary_n',
+    286: 'BoolBinary_eq',
+    287: 'BoolBinary_ne',
+    288: 'BoolBinary_gt',
+    289: 'BoolBinary_ge',
+    290: 'BoolBinary_lt',
+    291: 'BoolBinary_le',
+    292: 'BoolBinary_ef',
+    293: 'BoolBinary_nt',
+    294: 'BoolBinary_ot',
+    295: 'BoolBinary_GlobEqual',
+    296: 'BoolBinary_GlobDEqual',
+    297: 'BoolBinary_GlobNEqual',
+    298: 'BoolBinary_EqualTilde',
+    299: 'BoolBinary_Equal',
+    300: 'BoolBinary_DEqual',
+    301: 'BoolBinary_NEqual',
+}
+
+ID_TO_KIND = {
+    1: 0,
+    2: 1,
+    3: 2,
+    4: 3,
+    5: 3,
+    6: 3,
+    7: 4,
+    8: 4,
+    9: 4,
+    10: 5,
+    11: 6,
+    12: 6,
+    13: 6,
+    14: 6,
+    15: 6,
+    16: 6,
+    17: 6,
+    18: 6,
+    19: 6,
+    20: 6,
+    21: 6,
+    22: 6,
+    23: 6,
+    24: 6,
+    25: 6,
+    26: 6,
+    27: 6,
+    28: 6,
+    29: 7,
+    30: 7,
+    31: 7,
+    32: 8,
+    33: 8,
+    34: 8,
+    35: 8,
+    36: 9,
+    37: 9,
+    38: 9,
+    39: 9,
+    40: 9,
+    41: 9,
+    42: 9,
+    43: 9,
+    44: 9,
+    45: 9,
+    46: 9,
+    47: 9,
+    48: 9,
+    49: 9,
+    50: 9,
+    51: 9,
+    52: 9,
+    53: 10,
+    54: 10,
+    55: 10,
+    56: 10,
+    57: 10,
+    58: 10,
+    59: 10,
+    60: 10,
+    61: 10,
+    62: 10,
+    63: 10,
+    64: 10,
+    65: 10,
+    66: 10,
+    67: 11,
+    68: 11,
+    69: 12,
+    70: 12,
+    71: 12,
+    72: 12,
+    73: 12,
+    74: 12,
+    75: 12,
+    76: 12,
+    77: 12,
+    78: 12,
+    79: 12,
+    80: 12,
+    81: 12,
+    82: 12,
+    83: 13,
+    84: 13,
+    85: 13,
+    86: 13,
+    87: 13,
+    88: 13,
+    89: 13,
+    90: 13,
+    91: 13,
+    92: 13,
+    93: 13,
+    94: 13,
+    95: 13,
+    96: 14,
+    97: 14,
+    98: 14,
+    99: 14,
+    100: 14,
+    101: 15,
+    102: 15,
+    103: 15,
+    104: 15,
+    105: 15,
+    106: 15,
+    107: 15,
+    108: 15,
+    109: 15,
+    110: 15,
+    111: 16,
+    112: 16,
+    113: 16,
+    114: 16,
+    115: 16,
+    116: 16,
+    117: 16,
+    118: 16,
+    119: 17,
+    120: 17,
+    121: 17,
+    122: 17,
+    123: 17,
+    124: 18,
+    125: 18,
+    126: 18,
+    127: 18,
+    128: 18,
+    129: 18,
+    130: 18,
+    131: 18,
+    132: 19,
+    133: 19,
+    134: 19,
+    135: 19,
+    136: 20,
+    137: 20,
+    138: 20,
+    139: 20,
+    140: 20,
+    141: 20,
+    142: 20,
+    143: 20,
+    144: 20,
+    145: 20,
+    146: 20,
+    147: 20,
+    148: 20,
+    149: 20,
+    150: 20,
+    151: 20,
+    152: 20,
+    153: 20,
+    154: 20,
+    155: 20,
+    156: 20,
+    157: 20,
+    158: 20,
+    159: 20,
+    160: 20,
+    161: 20,
+    162: 20,
+    163: 20,
+    164: 20,
+    165: 20,
+    166: 20,
+    167: 20,
+    168: 20,
+    169: 20,
+    170: 20,
+    171: 20,
+    172: 20,
+    173: 20,
+    174: 20,
+    175: 20,
+    176: 20,
+    177: 20,
+    178: 20,
+    179: 21,
+    180: 21,
+    181: 21,
+    182: 21,
+    183: 21,
+    184: 21,
+    185: 21,
+    186: 21,
+    187: 21,
+    188: 21,
+    189: 21,
+    190: 21,
+    191: 21,
+    192: 21,
+    193: 21,
+    194: 21,
+    195: 21,
+    196: 21,
+    197: 21,
+    198: 22,
+    199: 23,
+    200: 23,
+    201: 23,
+    202: 23,
+    203: 23,
+    204: 23,
+    205: 23,
+    206: 23,
+    207: 23,
+    208: 23,
+    209: 23,
+    210: 23,
+    211: 23,
+    212: 23,
+    213: 23,
+    214: 23,
+    215: 23,
+    216: 23,
+    217: 23,
+    218: 23,
+    219: 23,
+    220: 23,
+    221: 23,
+    222: 23,
+    223: 23,
+    224: 23,
+    225: 23,
+    226: 24,
+    227: 24,
+    228: 24,
+    229: 24,
+    230: 24,
+    231: 25,
+    232: 25,
+    233: 25,
+    234: 25,
+    235: 26,
+    236: 26,
+    237: 26,
+    238: 26,
+    239: 26,
+    240: 26,
+    241: 26,
+    242: 26,
+    243: 26,
+    244: 27,
+    245: 27,
+    246: 27,
+    247: 27,
+    248: 27,
+    249: 27,
+    250: 27,
+    251: 27,
+    252: 27,
+    253: 27,
+    254: 27,
+    255: 28,
+    256: 28,
+    257: 28,
+    258: 28,
+    259: 28,
+    260: 28,
+    261: 29,
+    262: 29,
+    263: 29,
+    264: 29,
+    265: 29,
+    266: 29,
+    267: 29,
+    268: 29,
+    269: 29,
+    270: 29,
+    271: 29,
+    272: 29,
+    273: 29,
+    274: 29,
+    275: 29,
+    276: 29,
+    277: 29,
+    278: 29,
+    279: 29,
+    280: 29,
+    281: 29,
+    282: 29,
+    283: 29,
+    284: 29,
+    285: 29,
+    286: 30,
+    287: 30,
+    288: 30,
+    289: 30,
+    290: 30,
+    291: 30,
+    292: 30,
+    293: 30,
+    294: 30,
+    295: 30,
+    296: 30,
+    297: 30,
+    298: 30,
+    299: 30,
+    300: 30,
+    301: 30,
+}
+
+KIND_NAMES = {
+    'Arith': 20,
+    'Assign': 24,
+    'Backtick': 7,
+    'BoolBinary': 30,
+    'BoolUnary': 29,
+    'Char': 26,
+    'ControlFlow': 25,
+    'Eof': 3,
+    'Eol': 2,
+    'ExtGlob': 14,
+    'Fd': 11,
+    'Glob': 27,
+    'History': 8,
+    'Ignored': 4,
+    'KW': 23,
+    'Left': 12,
+    'Lit': 6,
+    'Node': 21,
+    'Op': 9,
+    'PS': 28,
+    'Redir': 10,
+    'Right': 13,
+    'Undefined': 0,
+    'Unknown': 1,
+    'VOp0': 17,
+    'VOp1': 18,
+    'VOp2': 19,
+    'VSub': 15,
+    'VTest': 16,
+    'WS': 5,
+    'Word': 22,
+}
+
+KIND_SIZES = [1, 1, 1, 3, 3, 1, 18, 3, 4, 17, 14, 2, 14, 13, 5, 10, 8, 5, 8, 4, 43, 19, 1, 27, 5, 4, 9, 11, 6, 25, 13]
+
+LEXER_PAIRS = {
+    16: [(False, ':-', 111), (False, '-', 112), (False, ':=', 113), (False, '=', 114), (False, ':?', 115), (False, '?', 116), (False, ':+', 117), (False, '+', 118)],
+    17: [(False, '@Q', 119), (False, '@E', 120), (False, '@P', 121), (False, '@A', 122), (False, '@a', 123)],
+    18: [(False, '%', 124), (False, '%%', 125), (False, '#', 126), (False, '##', 127), (False, '^', 128), (False, '^^', 129), (False, ',', 130), (False, ',,', 131)],
+    19: [(False, '/', 132), (False, ':', 133), (False, '[', 134), (False, ']', 135)],
+    20: [(False, ';', 136), (False, ',', 137), (False, '+', 138), (False, '-', 139), (False, '*', 140), (False, '/', 141), (False, '%', 142), (False, '++', 143), (False, '--', 144), (False, '**', 145), (False, '(', 146), (False, ')', 147), (False, '[', 148), (False, ']', 149), (False, '}', 150), (False, '?', 151), (False, ':', 152), (False, '<=', 153), (False, '<', 154), (False, '>=', 155), (False, '>', 156), (False, '==', 157), (False, '!=', 158), (False, '&&', 159), (False, '||', 160), (False, '!', 161), (False, '>>', 162), (False, '<<', 163), (False, '&', 164), (False, '|', 165), (False, '^', 166), (False, '~', 167), (False, '=', 168), (False, '+=', 169), (False, '-=', 170), (False, '*=', 171), (False, '/=', 172), (False, '%=', 173), (False, '>>=', 174), (False, '<<=', 175), (False, '&=', 176), (False, '|=', 177), (False, '^=', 178)],
+    29: [(False, '-o', 261), (False, '-t', 262), (False, '-v', 263), (False, '-R', 264), (False, '-a', 265), (False, '-b', 266), (False, '-c', 267), (False, '-d', 268), (False, '-e', 269), (False, '-f', 270), (False, '-g', 271), (False, '-h', 272), (False, '-L', 273), (False, '-p', 274), (False, '-r', 275), (False, '-s', 276), (False, '-S', 277), (False, '-u', 278), (False, '-w', 279), (False, '-x', 280), (False, '-O', 281), (False, '-G', 282), (False, '-N', 283), (False, '-z', 284), (False, '-n', 285)],
+    30: [(False, '-eq', 286), (False, '-ne', 287), (False, '-gt', 288), (False, '-ge', 289), (False, '-lt', 290), (False, '-le', 291), (False, '-ef', 292), (False, '-nt', 293), (False, '-ot', 294), (False, '=', 295), (False, '==', 296), (False, '!=', 297), (False, '=~', 298)],
+}
+
+BOOL_ARG_TYPES = {
+    40: 'Undefined',
+    41: 'Undefined',
+    53: 'Str',
+    54: 'Str',
+    200: 'Undefined',
+    261: 'Other',
+    262: 'Other',
+    263: 'Other',
+    264: 'Other',
+    265: 'Path',
+    266: 'Path',
+    267: 'Path',
+    268: 'Path',
+    269: 'Path',
+    270: 'Path',
+    271: 'Path',
+    272: 'Path',
+    273: 'Path',
+    274: 'Path',
+    275: 'Path',
+    276: 'Path',
+    277: 'Path',
+    278: 'Path',
+    279: 'Path',
+    280: 'Path',
+    281: 'Path',
+    282: 'Path',
+    283: 'Path',
+    284: 'Str',
+    285: 'Str',
+    286: 'Int',
+    287: 'Int',
+    288: 'Int',
+    289: 'Int',
+    290: 'Int',
+    291: 'Int',
+    292: 'Path',
+    293: 'Path',
+    294: 'Path',
+    295: 'Str',
+    296: 'Str',
+    297: 'Str',
+    298: 'Str',
+    299: 'Str',
+    300: 'Str',
+    301: 'Str',
+}
+
+TEST_UNARY_LOOKUP = {
+    '-G': 282,
+    '-L': 273,
+    '-N': 283,
+    '-O': 281,
+    '-R': 264,
+    '-S': 277,
+    '-a': 265,
+    '-b': 266,
+    '-c': 267,
+    '-d': 268,
+    '-e': 269,
+    '-f': 270,
+    '-g': 271,
+    '-h': 272,
+    '-n': 285,
+    '-o': 261,
+    '-p': 274,
+    '-r': 275,
+    '-s': 276,
+    '-t': 262,
+    '-u': 278,
+    '-v': 263,
+    '-w': 279,
+    '-x': 280,
+    '-z': 284,
+}
+
+TEST_BINARY_LOOKUP = {
+    '!=': 301,
+    '-ef': 292,
+    '-eq': 286,
+    '-ge': 289,
+    '-gt': 288,
+    '-le': 291,
+    '-lt': 290,
+    '-ne': 287,
+    '-nt': 293,
+    '-ot': 294,
+    '<': 53,
+    '=': 299,
+    '==': 300,
+    '>': 54,
+}
+
+TEST_OTHER_LOOKUP = {
+    '!': 200,
+    '(': 44,
+    ')': 45,
+    ']': 149,
+}
+
@@ -0,0 +1,120 @@
+TOPIC_LOOKUP = {'!': '2-2-4',
+ '&': '2-5-2',
+ '&&': '2-2-5',
+ '((': '2-7-1',
+ ':': '2-2-3',
+ 'ASSIGNING-VARIABLES': '3-0-0',
+ 'Arithmetic': '5-1-0',
+ 'BUILTIN-COMMANDS': '6-0-0',
+ 'Boolean': '5-2-0',
+ 'Brace-Expand': '5-4-0',
+ 'Builtin-Procs': '12-2-0',
+ 'COMMAND-LANGUAGE': '2-0-0',
+ 'COMPREPLY': '9-7-5',
+ 'COMP_ARGV': '9-7-6',
+ 'COMP_CWORD': '9-7-2',
+ 'COMP_LINE': '9-7-3',
+ 'COMP_POINT': '9-7-4',
+ 'COMP_WORDS': '9-7-1',
+ 'Call': '9-2-0',
+ 'Child-Process': '6-7-0',
+ 'Commands': '2-1-0',
+ 'Completion': '9-7-0',
+ 'Compound-Data': '3-3-0',
+ 'Concurrency': '2-5-0',
+ 'Conditional': '2-3-0',
+ 'ENVIRONMENT-VARIABLES': '8-0-0',
+ 'Execution': '7-2-0',
+ 'External': '6-9-0',
+ 'Grouping': '2-4-0',
+ 'I/O': '6-1-0',
+ 'INTRO': '1-0-0',
+ 'Introspection': '6-8-0',
+ 'Keywords': '3-1-0',
+ 'Lexing': '1-4-0',
+ 'OIL-EXTENSINOS': '11-0-0',
+ 'OIL-LIBRARIES': '12-0-0',
+ 'OSH-Options': '7-3-0',
+ 'OTHER-SHELL-SUBLANGUAGES': '5-0-0',
+ 'Oil': '1-4-0',
+ 'Operators': '3-2-0',
+ 'Other': '2-7-0',
+ 'Overview': '1-1-0',
+ 'PLUGINS-AND-HOOKS': '10-0-0',
+ 'PS1': '10-3-1',
+ 'PS2': '10-3-2',
+ 'PS3': '10-3-3',
+ 'PS4': '10-3-4',
+ 'Parsing': '7-1-0',
+ 'Patterns': '5-3-0',
+ 'Platform': '9-1-0',
+ 'Process': '9-5-0',
+ 'Quotes': '4-1-0',
+ 'Redirects': '2-6-0',
+ 'Run-Code': '6-2-0',
+ 'SHELL-OPTIONS': '7-0-0',
+ 'SPECIAL-VARIABLES': '9-0-0',
+ 'Set-Options': '6-3-0',
+ 'Shell': '9-6-0',
+ 'Shell-Process': '6-6-0',
+ 'Signals': '10-1-0',
+ 'Special-Vars': '4-3-0',
+ 'Stack': '9-5-0',
+ 'State': '9-6-0',
+ 'Substitutions': '4-2-0',
+ 'Tracing': '9-3-0',
+ 'Traps': '10-2-0',
+ 'Usage': '1-2-0',
+ 'Var-Ops': '4-4-0',
+ 'WORD-LANGUAGE': '4-0-0',
+ 'Words': '10-3-0',
+ 'Working-Dir': '6-4-0',
+ '[[': '2-2-6',
+ 'ampersand': '2-5-2',
+ 'and': '2-2-5',
+ 'bang': '2-2-4',
+ 'block': '2-4-2',
+ 'bundle-usage': '1-2-1',
+ 'caller': '6-8-3',
+ 'case': '2-2-1',
+ 'colon': '2-2-3',
+ 'compadjust': '6-5-4',
+ 'compgen': '6-5-2',
+ 'complete': '6-5-1',
+ 'compopt': '6-5-3',
+ 'config': '1-2-4',
+ 'coproc': '2-7-3',
+ 'dbracket': '2-2-6',
+ 'dparen': '2-7-1',
+ 'enable': '6-9-3',
+ 'false': '2-2-3',
+ 'for': '2-3-2',
+ 'for-expr': '2-3-2',
+ 'function': '2-4-1',
+ 'getopt': '6-9-1',
+ 'hash': '6-8-2',
+ 'help': '6-8-1',
+ 'here-doc': '2-6-3',
+ 'if': '2-2-2',
+ 'kill': '6-9-2',
+ 'line-editing': '1-2-6',
+ 'oil-usage': '1-2-3',
+ 'or': '2-2-5',
+ 'osh-usage': '1-2-2',
+ 'overview': '1-1-1',
+ 'pipe': '2-5-1',
+ 'prompt': '1-2-7',
+ 'read': '6-1-1',
+ 'redir-desc': '2-6-2',
+ 'redir-file': '2-6-1',
+ 'semicolon': '2-1-2',
+ 'simple-command': '2-1-1',
+ 'single-command': '1-4-1',
+ 'startup': '1-2-5',
+ 'subshell': '2-4-3',
+ 'time': '2-7-2',
+ 'true': '2-2-3',
+ 'type': '6-8-4',
+ 'until': '2-3-1',
+ 'while': '2-3-1',
+ '||': '2-2-5'}
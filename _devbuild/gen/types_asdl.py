@@ -0,0 +1,53 @@
+from asdl import const  # For const.NO_INTEGER
+from asdl import runtime
+from pylib import unpickle
+
+from core import util
+
+f = util.GetResourceLoader().open('_devbuild/types_asdl.pickle')
+TYPE_LOOKUP = unpickle.load_v2_subset(f)
+f.close()
+
+class bool_arg_type_e(runtime.SimpleObj):
+  ASDL_TYPE = TYPE_LOOKUP['bool_arg_type']
+
+bool_arg_type_e.Undefined = bool_arg_type_e(1, 'Undefined')
+bool_arg_type_e.Path = bool_arg_type_e(2, 'Path')
+bool_arg_type_e.Int = bool_arg_type_e(3, 'Int')
+bool_arg_type_e.Str = bool_arg_type_e(4, 'Str')
+bool_arg_type_e.Other = bool_arg_type_e(5, 'Other')
+
+class redir_arg_type_e(runtime.SimpleObj):
+  ASDL_TYPE = TYPE_LOOKUP['redir_arg_type']
+
+redir_arg_type_e.Path = redir_arg_type_e(1, 'Path')
+redir_arg_type_e.Desc = redir_arg_type_e(2, 'Desc')
+redir_arg_type_e.Here = redir_arg_type_e(3, 'Here')
+
+class lex_mode_e(runtime.SimpleObj):
+  ASDL_TYPE = TYPE_LOOKUP['lex_mode']
+
+lex_mode_e.Undefined = lex_mode_e(1, 'Undefined')
+lex_mode_e.Comment = lex_mode_e(2, 'Comment')
+lex_mode_e.Outer = lex_mode_e(3, 'Outer')
+lex_mode_e.Backtick = lex_mode_e(4, 'Backtick')
+lex_mode_e.DBracket = lex_mode_e(5, 'DBracket')
+lex_mode_e.SQ = lex_mode_e(6, 'SQ')
+lex_mode_e.DQ = lex_mode_e(7, 'DQ')
+lex_mode_e.DollarSQ = lex_mode_e(8, 'DollarSQ')
+lex_mode_e.Arith = lex_mode_e(9, 'Arith')
+lex_mode_e.ExtGlob = lex_mode_e(10, 'ExtGlob')
+lex_mode_e.VS_1 = lex_mode_e(11, 'VS_1')
+lex_mode_e.VS_2 = lex_mode_e(12, 'VS_2')
+lex_mode_e.VS_ArgUnquoted = lex_mode_e(13, 'VS_ArgUnquoted')
+lex_mode_e.VS_ArgDQ = lex_mode_e(14, 'VS_ArgDQ')
+lex_mode_e.BashRegex = lex_mode_e(15, 'BashRegex')
+lex_mode_e.BashRegexChars = lex_mode_e(16, 'BashRegexChars')
+lex_mode_e.OilOuter = lex_mode_e(17, 'OilOuter')
+lex_mode_e.OilWords = lex_mode_e(18, 'OilWords')
+lex_mode_e.OilExpr = lex_mode_e(19, 'OilExpr')
+lex_mode_e.OilSQ = lex_mode_e(20, 'OilSQ')
+lex_mode_e.OilDQ = lex_mode_e(21, 'OilDQ')
+lex_mode_e.OilRawSQ = lex_mode_e(22, 'OilRawSQ')
+lex_mode_e.OilRawDQ = lex_mode_e(23, 'OilRawDQ')
+
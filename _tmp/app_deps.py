@@ -0,0 +1 @@
+/root/package/build/app_deps.py
\ No newline at end of file
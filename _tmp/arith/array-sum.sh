@@ -0,0 +1,6 @@
+a=(1 2 3 4 5 6 7 8 9 10)
+sum=0
+for (( i = 0; i < N; i++ )); do
+  (( sum += a[i % 10] ))
+done
+echo $sum
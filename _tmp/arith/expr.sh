@@ -0,0 +1,5 @@
+a=3 b=5 sum=0
+for (( i = 0; i < N; i++ )); do
+  (( sum += (a * i + b) % 7 - (i >> 1 & 3) ))
+done
+echo $sum
@@ -0,0 +1,5 @@
+a=0 b=1
+for (( i = 0; i < N; i++ )); do
+  (( t = (a + b) % 1000007, a = b, b = t ))
+done
+echo $a
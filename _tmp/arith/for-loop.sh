@@ -0,0 +1,4 @@
+for (( i = 0; i < N; i++ )); do
+  :
+done
+echo $i
@@ -0,0 +1,5 @@
+i=0
+while (( i < N )); do
+  i=$(( i + 1 ))
+done
+echo $i